@@ -1,6 +1,8 @@
 # app/database.py
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
@@ -11,12 +13,23 @@ load_dotenv()
 # Get database URL from environment or use default
 DATABASE_URL = os.getenv("DATABASE_URL", f"postgresql://{os.getenv('DATABASE_USER','ammuser')}:{os.getenv('DATABASE_PASSWORD','ammpassword')}@{os.getenv('DATABASE_HOST','localhost')}:{os.getenv('DATABASE_PORT','5432')}/{os.getenv('DATABASE_NAME','amm_db')}")
 
+# The executemany options below are psycopg2-only, so pin the sync driver
+# rather than rely on the dialect default for a plain postgresql:// URL
+SYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+psycopg2")
+
 # Create SQLAlchemy engine
 engine = create_engine(
-    DATABASE_URL,
+    SYNC_DATABASE_URL,
     echo=False,  # Set to True to log SQL queries
     pool_size=10,
     max_overflow=20,
+    pool_pre_ping=True,  # Test connections on checkout to drop stale ones
+    pool_recycle=1800,  # Recycle connections older than 30 minutes
+    pool_timeout=10,
+    # psycopg2 fast execution helpers: batch executemany() into multi-row statements
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
 )
 
 # Create session factory
@@ -24,17 +37,48 @@ SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
     bind=engine,
+    expire_on_commit=False,  # Keep loaded rows usable after commit
+)
+
+# Async engine (asyncpg) for routes that run on the event loop
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+# Prepared statements cached per connection; set to 0 behind pgbouncer in transaction mode
+STATEMENT_CACHE_SIZE = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "100"))
+
+# All routes share the async pool; keep (pool size + overflow) x workers below
+# the server's max_connections
+POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_timeout=10,
+    connect_args={
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+    },
+)
+
+# Create async session factory
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
 
 def get_db():
     """
-    Dependency for FastAPI to inject database session into route handlers.
+    Dependency that yields a synchronous Session.
     
-    Usage in routes:
-        @router.get("/pools")
-        def get_pools(db: Session = Depends(get_db)):
-            return db.query(Pool).all()
+    Routes use ``get_async_db``; this is kept for scripts and sync callers.
     """
     db = SessionLocal()
     try:
@@ -43,6 +87,20 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Async dependency for FastAPI to inject an AsyncSession into route handlers.
+    
+    Usage in routes:
+        @router.get("/experiments")
+        async def list_experiments(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Experiment))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Create all tables in the database."""
     from app.models import Base
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import time
 from uuid import UUID
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy import bindparam, select, insert, update, exists, func, tuple_
 
 from app.models import Experiment, Group, AdminUser
 
@@ -27,28 +29,141 @@ class InvalidAdminError(Exception):
     pass
 
 
-def get_experiment_by_id(db: Session, experiment_id: UUID) -> Optional[Experiment]:
+# Rows per multi-row INSERT when creating groups (2 params per row keeps
+# each statement far below Postgres' 65535 bind-parameter limit)
+GROUP_INSERT_BATCH_SIZE = 1000
+
+# Positive admin checks are reused for this long (seconds)
+ADMIN_CHECK_TTL_SECONDS = 30
+_ADMIN_CHECK_CACHE_MAXSIZE = 1024
+_verified_admins: dict[UUID, float] = {}
+
+# Listing totals (per creator filter) are reused for this long (seconds);
+# creating or deleting an experiment drops them immediately
+EXPERIMENT_COUNT_TTL_SECONDS = 30
+_EXPERIMENT_COUNT_CACHE_MAXSIZE = 1024
+_experiment_counts: dict[Optional[UUID], tuple[float, int]] = {}
+
+# Built once so every lookup hits the same compiled-statement cache entry.
+# Response schemas only read columns (plus explicitly eager-loaded groups),
+# so queries raise on any other relationship access instead of lazy-loading.
+_GROUPS_BY_EXPERIMENT = (
+    select(Group)
+    .where(Group.experiment_id == bindparam("experiment_id"))
+    .options(raiseload("*"))
+)
+
+
+async def get_experiment_by_id(db: AsyncSession, experiment_id: UUID) -> Optional[Experiment]:
     """Get an experiment by ID."""
-    return db.query(Experiment).filter(Experiment.id == experiment_id).first()
+    return await db.get(Experiment, experiment_id)
+
+
+async def is_admin(db: AsyncSession, user_id: UUID) -> bool:
+    """Check whether a user is an admin.
+    
+    Positive answers are cached in-process for ADMIN_CHECK_TTL_SECONDS, so an
+    admin creating several experiments in a row is only checked once.
+    """
+    now = time.monotonic()
+    verified_at = _verified_admins.get(user_id)
+    if verified_at is not None and now - verified_at < ADMIN_CHECK_TTL_SECONDS:
+        return True
+    
+    result = await db.execute(select(exists().where(AdminUser.id == user_id)))
+    if not result.scalar():
+        return False
+    
+    if len(_verified_admins) >= _ADMIN_CHECK_CACHE_MAXSIZE:
+        _verified_admins.clear()
+    _verified_admins[user_id] = now
+    return True
+
 
+async def experiment_exists(db: AsyncSession, experiment_id: UUID) -> bool:
+    """Check whether an experiment exists."""
+    result = await db.execute(select(exists().where(Experiment.id == experiment_id)))
+    return result.scalar()
 
-def get_all_experiments(
-    db: Session,
+
+async def get_experiment_with_groups_by_id(db: AsyncSession, experiment_id: UUID) -> Optional[Experiment]:
+    """Get an experiment by ID with its groups eagerly loaded."""
+    result = await db.execute(
+        select(Experiment)
+        .options(selectinload(Experiment.groups), raiseload("*"))
+        .where(Experiment.id == experiment_id)
+    )
+    return result.scalars().first()
+
+
+async def get_all_experiments(
+    db: AsyncSession,
     skip: int = 0,
     limit: int = 100,
     created_by_id: Optional[UUID] = None,
-) -> list[Experiment]:
-    """Get all experiments with optional filtering by creator."""
-    query = db.query(Experiment)
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+) -> tuple[list[Experiment], int]:
+    """Get a page of experiments (newest first) and the total matching count.
+    
+    Pass the last row's ``created_at``/``id`` as ``after_created_at``/``after_id``
+    to seek straight to the next page instead of scanning past ``skip`` rows.
+    The total comes from a short-lived cache, so paging does not recount.
+    """
+    query = select(Experiment).options(raiseload("*"))
+    if created_by_id:
+        query = query.where(Experiment.created_by_id == created_by_id)
+    
+    if after_created_at is not None and after_id is not None:
+        query = query.where(
+            tuple_(Experiment.created_at, Experiment.id) < tuple_(after_created_at, after_id)
+        )
+    
+    query = query.order_by(Experiment.created_at.desc(), Experiment.id.desc())
+    experiments = list((await db.scalars(query.offset(skip).limit(limit))).all())
+    return experiments, await _count_experiments(db, created_by_id)
+
+
+async def _count_experiments(db: AsyncSession, created_by_id: Optional[UUID]) -> int:
+    """Count experiments (optionally by creator), cached for EXPERIMENT_COUNT_TTL_SECONDS."""
+    now = time.monotonic()
+    cached = _experiment_counts.get(created_by_id)
+    if cached is not None and now - cached[0] < EXPERIMENT_COUNT_TTL_SECONDS:
+        return cached[1]
     
+    query = select(func.count()).select_from(Experiment)
     if created_by_id:
-        query = query.filter(Experiment.created_by_id == created_by_id)
+        query = query.where(Experiment.created_by_id == created_by_id)
+    total = (await db.execute(query)).scalar_one()
     
-    return query.offset(skip).limit(limit).all()
+    if len(_experiment_counts) >= _EXPERIMENT_COUNT_CACHE_MAXSIZE:
+        _experiment_counts.clear()
+    _experiment_counts[created_by_id] = (now, total)
+    return total
 
 
-def create_experiment(
-    db: Session,
+async def stream_experiments(
+    db: AsyncSession,
+    created_by_id: Optional[UUID] = None,
+    batch_size: int = 500,
+) -> AsyncIterator[list[Experiment]]:
+    """Stream all experiments (newest first) in batches of ``batch_size`` rows.
+    
+    Rows are fetched from a server-side cursor, so memory stays bounded by
+    ``batch_size`` regardless of how many experiments exist.
+    """
+    query = select(Experiment).options(raiseload("*"))
+    if created_by_id:
+        query = query.where(Experiment.created_by_id == created_by_id)
+    query = query.order_by(Experiment.created_at.desc(), Experiment.id.desc())
+    
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.scalars().partitions():
+        yield partition
+
+
+async def create_experiment(
+    db: AsyncSession,
     name: str,
     num_rounds: int,
     num_training_rounds: int,
@@ -59,106 +174,139 @@ def create_experiment(
 ) -> Experiment:
     """Create a new experiment and its groups."""
     # Verify the creator is an admin
-    admin = db.query(AdminUser).filter(AdminUser.id == created_by_id).first()
-    if not admin:
+    if not await is_admin(db, created_by_id):
         raise InvalidAdminError(f"User {created_by_id} is not an admin")
     
-    # Create experiment
-    experiment = Experiment(
-        name=name,
-        num_rounds=num_rounds,
-        num_training_rounds=num_training_rounds,
-        num_rounds_for_payment=num_rounds_for_payment,
-        num_players=num_players,
-        num_groups=num_groups,
-        created_by_id=created_by_id,
+    # Create experiment; RETURNING hands back the generated ID and defaults
+    result = await db.execute(
+        insert(Experiment)
+        .values(
+            name=name,
+            num_rounds=num_rounds,
+            num_training_rounds=num_training_rounds,
+            num_rounds_for_payment=num_rounds_for_payment,
+            num_players=num_players,
+            num_groups=num_groups,
+            created_by_id=created_by_id,
+        )
+        .returning(Experiment)
     )
+    experiment = result.scalar_one()
     
-    db.add(experiment)
-    db.flush()  # Get the experiment ID
-    
-    # Automatically create groups for this experiment
-    for group_num in range(1, num_groups + 1):
-        group = Group(
-            experiment_id=experiment.id,
-            group_number=group_num,
+    # Automatically create groups for this experiment, one multi-row INSERT per batch
+    for batch_start in range(1, num_groups + 1, GROUP_INSERT_BATCH_SIZE):
+        batch_end = min(batch_start + GROUP_INSERT_BATCH_SIZE, num_groups + 1)
+        await db.execute(
+            insert(Group),
+            [
+                {"experiment_id": experiment.id, "group_number": group_num}
+                for group_num in range(batch_start, batch_end)
+            ],
         )
-        db.add(group)
     
-    db.commit()
-    db.refresh(experiment)
+    await db.commit()
+    _experiment_counts.clear()
     return experiment
 
 
-def update_experiment(
-    db: Session,
+async def update_experiment(
+    db: AsyncSession,
     experiment_id: UUID,
     **update_data,
 ) -> Experiment:
-    """Update an experiment."""
-    experiment = get_experiment_by_id(db, experiment_id)
+    """Update an experiment with a single UPDATE ... RETURNING."""
+    # Update only provided fields
+    values = {
+        field: value
+        for field, value in update_data.items()
+        if value is not None and hasattr(Experiment, field)
+    }
+    if not values:
+        experiment = await get_experiment_by_id(db, experiment_id)
+        if not experiment:
+            raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
+        return experiment
+    
+    result = await db.execute(
+        update(Experiment)
+        .where(Experiment.id == experiment_id)
+        .values(**values)
+        .returning(Experiment)
+    )
+    experiment = result.scalars().first()
     if not experiment:
         raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
     
-    # Update only provided fields
-    for field, value in update_data.items():
-        if value is not None and hasattr(experiment, field):
-            setattr(experiment, field, value)
-    
-    db.commit()
-    db.refresh(experiment)
+    await db.commit()
     return experiment
 
 
-def start_experiment(db: Session, experiment_id: UUID) -> Experiment:
-    """Mark an experiment as started."""
-    experiment = get_experiment_by_id(db, experiment_id)
-    if not experiment:
-        raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
+async def start_experiment(db: AsyncSession, experiment_id: UUID) -> Experiment:
+    """Mark an experiment as started.
     
-    if experiment.started_at:
+    The ``started_at IS NULL`` guard is applied in the UPDATE itself, so
+    concurrent starts cannot both succeed.
+    """
+    result = await db.execute(
+        update(Experiment)
+        .where(Experiment.id == experiment_id, Experiment.started_at.is_(None))
+        .values(started_at=func.now())
+        .returning(Experiment)
+    )
+    experiment = result.scalars().first()
+    if not experiment:
+        if not await experiment_exists(db, experiment_id):
+            raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
         raise ValueError("Experiment has already been started")
     
-    experiment.started_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(experiment)
+    await db.commit()
     return experiment
 
 
-def end_experiment(db: Session, experiment_id: UUID) -> Experiment:
+async def end_experiment(db: AsyncSession, experiment_id: UUID) -> Experiment:
     """Mark an experiment as ended."""
-    experiment = get_experiment_by_id(db, experiment_id)
+    result = await db.execute(
+        update(Experiment)
+        .where(
+            Experiment.id == experiment_id,
+            Experiment.started_at.is_not(None),
+            Experiment.ended_at.is_(None),
+        )
+        .values(ended_at=func.now())
+        .returning(Experiment)
+    )
+    experiment = result.scalars().first()
     if not experiment:
-        raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
-    
-    if not experiment.started_at:
-        raise ValueError("Cannot end an experiment that hasn't started")
-    
-    if experiment.ended_at:
+        # Nothing matched: work out which precondition failed
+        experiment = await get_experiment_by_id(db, experiment_id)
+        if not experiment:
+            raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
+        if not experiment.started_at:
+            raise ValueError("Cannot end an experiment that hasn't started")
         raise ValueError("Experiment has already ended")
     
-    experiment.ended_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(experiment)
+    await db.commit()
     return experiment
 
 
-def delete_experiment(db: Session, experiment_id: UUID) -> bool:
+async def delete_experiment(db: AsyncSession, experiment_id: UUID) -> bool:
     """Delete an experiment and all related data."""
-    experiment = get_experiment_by_id(db, experiment_id)
+    experiment = await get_experiment_by_id(db, experiment_id)
     if not experiment:
         raise ExperimentNotFoundError(f"Experiment {experiment_id} not found")
     
-    db.delete(experiment)
-    db.commit()
+    await db.delete(experiment)
+    await db.commit()
+    _experiment_counts.clear()
     return True
 
 
-def get_groups_by_experiment(db: Session, experiment_id: UUID) -> list[Group]:
+async def get_groups_by_experiment(db: AsyncSession, experiment_id: UUID) -> list[Group]:
     """Get all groups for an experiment."""
-    return db.query(Group).filter(Group.experiment_id == experiment_id).all()
+    result = await db.execute(_GROUPS_BY_EXPERIMENT, {"experiment_id": experiment_id})
+    return list(result.scalars().all())
 
 
-def get_group_by_id(db: Session, group_id: UUID) -> Optional[Group]:
+async def get_group_by_id(db: AsyncSession, group_id: UUID) -> Optional[Group]:
     """Get a group by ID."""
-    return db.query(Group).filter(Group.id == group_id).first()
+    return await db.get(Group, group_id)
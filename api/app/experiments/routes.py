@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from uuid import UUID
+from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .schemas import (
     ExperimentCreate,
@@ -14,25 +17,31 @@ from .schemas import (
     ExperimentResponse,
     ExperimentWithGroups,
     ExperimentListResponse,
+    ExperimentCursor,
     GroupResponse,
     ErrorResponse,
 )
 from .repository import (
     create_experiment as repo_create_experiment,
     get_experiment_by_id,
+    get_experiment_with_groups_by_id,
     get_all_experiments,
+    stream_experiments as repo_stream_experiments,
     update_experiment as repo_update_experiment,
     start_experiment as repo_start_experiment,
     end_experiment as repo_end_experiment,
     delete_experiment as repo_delete_experiment,
     get_groups_by_experiment,
-    ExperimentNotFoundError,
-    InvalidAdminError,
 )
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_async_db
+from app.rounds import cache as round_cache
 
 router = APIRouter()
 
+# Prebuilt adapters so list responses are validated in a single pydantic-core call
+EXPERIMENT_LIST_ADAPTER = TypeAdapter(list[ExperimentResponse])
+GROUP_LIST_ADAPTER = TypeAdapter(list[GroupResponse])
+
 
 # -------------------- Routes -------------------- #
 
@@ -42,10 +51,10 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     responses={400: {"model": ErrorResponse}, 403: {"model": ErrorResponse}},
 )
-def create_experiment(
+async def create_experiment(
     experiment_data: ExperimentCreate,
     created_by_id: UUID,  # TODO: Get from JWT token in real implementation
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new experiment with groups.
     
@@ -53,55 +62,83 @@ def create_experiment(
     
     TODO: Replace created_by_id parameter with JWT authentication.
     """
-    try:
-        experiment = repo_create_experiment(
-            db=db,
-            name=experiment_data.name,
-            num_rounds=experiment_data.num_rounds,
-            num_training_rounds=experiment_data.num_training_rounds,
-            num_rounds_for_payment=experiment_data.num_rounds_for_payment,
-            num_players=experiment_data.num_players,
-            num_groups=experiment_data.num_groups,
-            created_by_id=created_by_id,
-        )
-        return ExperimentResponse.model_validate(experiment)
-    
-    except InvalidAdminError as e:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create experiment: {str(e)}",
-        )
+    experiment = await repo_create_experiment(
+        db=db,
+        name=experiment_data.name,
+        num_rounds=experiment_data.num_rounds,
+        num_training_rounds=experiment_data.num_training_rounds,
+        num_rounds_for_payment=experiment_data.num_rounds_for_payment,
+        num_players=experiment_data.num_players,
+        num_groups=experiment_data.num_groups,
+        created_by_id=created_by_id,
+    )
+    return ExperimentResponse.model_validate(experiment)
 
 
 @router.get(
     "/",
     response_model=ExperimentListResponse,
 )
-def list_experiments(
+async def list_experiments(
     skip: int = 0,
     limit: int = 100,
     created_by_id: UUID = None,  # Optional filter
-    db: Session = Depends(get_db),
+    after_created_at: datetime = None,  # Keyset cursor (from next_cursor)
+    after_id: UUID = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all experiments with optional filtering."""
-    try:
-        experiments = get_all_experiments(
-            db, skip=skip, limit=limit, created_by_id=created_by_id
-        )
-        return ExperimentListResponse(
-            experiments=[ExperimentResponse.model_validate(e) for e in experiments],
-            total=len(experiments),
-        )
-    except Exception as e:
+    """List all experiments with optional filtering.
+    
+    Pass the previous page's ``next_cursor`` values as ``after_created_at`` and
+    ``after_id`` to fetch the next page.
+    """
+    if (after_created_at is None) != (after_id is None):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list experiments: {str(e)}",
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="after_created_at and after_id must be given together",
         )
+    
+    experiments, total = await get_all_experiments(
+        db,
+        skip=skip,
+        limit=limit,
+        created_by_id=created_by_id,
+        after_created_at=after_created_at,
+        after_id=after_id,
+    )
+    next_cursor = None
+    if experiments and len(experiments) == limit:
+        last = experiments[-1]
+        next_cursor = ExperimentCursor(after_created_at=last.created_at, after_id=last.id)
+    return ExperimentListResponse(
+        experiments=EXPERIMENT_LIST_ADAPTER.validate_python(experiments, from_attributes=True),
+        total=total,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def stream_experiments(
+    created_by_id: UUID = None,  # Optional filter
+):
+    """Stream all experiments as newline-delimited JSON.
+    
+    Intended for exports/dashboards that need every experiment; rows are read
+    in batches from a server-side cursor instead of being loaded all at once.
+    The session is opened by the body generator itself, so it stays open for
+    as long as the response is streaming.
+    """
+    async def ndjson_lines():
+        async with AsyncSessionLocal() as db:
+            async for partition in repo_stream_experiments(db, created_by_id=created_by_id):
+                items = EXPERIMENT_LIST_ADAPTER.validate_python(partition, from_attributes=True)
+                yield b"".join(item.model_dump_json().encode() + b"\n" for item in items)
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -109,26 +146,18 @@ def list_experiments(
     response_model=ExperimentResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def get_experiment(
+async def get_experiment(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get an experiment by ID."""
-    try:
-        experiment = get_experiment_by_id(db, experiment_id)
-        if not experiment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Experiment {experiment_id} not found",
-            )
-        return ExperimentResponse.model_validate(experiment)
-    except HTTPException:
-        raise
-    except Exception as e:
+    experiment = await get_experiment_by_id(db, experiment_id)
+    if not experiment:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get experiment: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Experiment {experiment_id} not found",
         )
+    return ExperimentResponse.model_validate(experiment)
 
 
 @router.get(
@@ -136,32 +165,19 @@ def get_experiment(
     response_model=ExperimentWithGroups,
     responses={404: {"model": ErrorResponse}},
 )
-def get_experiment_with_groups(
+async def get_experiment_with_groups(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get an experiment with all its groups."""
-    try:
-        experiment = get_experiment_by_id(db, experiment_id)
-        if not experiment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Experiment {experiment_id} not found",
-            )
-        
-        groups = get_groups_by_experiment(db, experiment_id)
-        
-        return ExperimentWithGroups(
-            **ExperimentResponse.model_validate(experiment).model_dump(),
-            groups=[GroupResponse.model_validate(g) for g in groups],
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    experiment = await get_experiment_with_groups_by_id(db, experiment_id)
+    if not experiment:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get experiment with groups: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Experiment {experiment_id} not found",
         )
+    
+    return ExperimentWithGroups.model_validate(experiment)
 
 
 @router.patch(
@@ -169,29 +185,17 @@ def get_experiment_with_groups(
     response_model=ExperimentResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def update_experiment(
+async def update_experiment(
     experiment_id: UUID,
     experiment_data: ExperimentUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update an experiment."""
-    try:
-        # Only pass non-None values
-        update_dict = experiment_data.model_dump(exclude_unset=True)
-        
-        experiment = repo_update_experiment(db, experiment_id, **update_dict)
-        return ExperimentResponse.model_validate(experiment)
+    # Only pass non-None values
+    update_dict = experiment_data.model_dump(exclude_unset=True)
     
-    except ExperimentNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update experiment: {str(e)}",
-        )
+    experiment = await repo_update_experiment(db, experiment_id, **update_dict)
+    return ExperimentResponse.model_validate(experiment)
 
 
 @router.post(
@@ -199,30 +203,20 @@ def update_experiment(
     response_model=ExperimentResponse,
     responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
 )
-def start_experiment(
+async def start_experiment(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Start an experiment (set started_at timestamp)."""
     try:
-        experiment = repo_start_experiment(db, experiment_id)
+        experiment = await repo_start_experiment(db, experiment_id)
         return ExperimentResponse.model_validate(experiment)
     
-    except ExperimentNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start experiment: {str(e)}",
-        )
 
 
 @router.post(
@@ -230,30 +224,20 @@ def start_experiment(
     response_model=ExperimentResponse,
     responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
 )
-def end_experiment(
+async def end_experiment(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """End an experiment (set ended_at timestamp)."""
     try:
-        experiment = repo_end_experiment(db, experiment_id)
+        experiment = await repo_end_experiment(db, experiment_id)
         return ExperimentResponse.model_validate(experiment)
     
-    except ExperimentNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to end experiment: {str(e)}",
-        )
 
 
 @router.delete(
@@ -261,25 +245,14 @@ def end_experiment(
     status_code=status.HTTP_204_NO_CONTENT,
     responses={404: {"model": ErrorResponse}},
 )
-def delete_experiment(
+async def delete_experiment(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete an experiment and all related data."""
-    try:
-        repo_delete_experiment(db, experiment_id)
-        return None
-    
-    except ExperimentNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete experiment: {str(e)}",
-        )
+    await repo_delete_experiment(db, experiment_id)
+    round_cache.invalidate_experiment(experiment_id)
+    return None
 
 
 @router.get(
@@ -287,27 +260,18 @@ def delete_experiment(
     response_model=List[GroupResponse],
     responses={404: {"model": ErrorResponse}},
 )
-def list_experiment_groups(
+async def list_experiment_groups(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all groups for an experiment."""
-    try:
-        # Verify experiment exists
-        experiment = get_experiment_by_id(db, experiment_id)
-        if not experiment:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Experiment {experiment_id} not found",
-            )
-        
-        groups = get_groups_by_experiment(db, experiment_id)
-        return [GroupResponse.model_validate(g) for g in groups]
-    
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Verify experiment exists
+    experiment = await get_experiment_by_id(db, experiment_id)
+    if not experiment:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list groups: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Experiment {experiment_id} not found",
         )
+    
+    groups = await get_groups_by_experiment(db, experiment_id)
+    return GROUP_LIST_ADAPTER.validate_python(groups, from_attributes=True)
@@ -6,7 +6,7 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # -------------------- Request Schemas -------------------- #
@@ -41,17 +41,18 @@ class GroupCreate(BaseModel):
 
 class GroupResponse(BaseModel):
     """Response schema for a group."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     experiment_id: UUID
     group_number: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ExperimentResponse(BaseModel):
     """Response schema for an experiment."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     name: str
     num_rounds: int
@@ -64,19 +65,23 @@ class ExperimentResponse(BaseModel):
     ended_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ExperimentWithGroups(ExperimentResponse):
     """Response schema for experiment with groups."""
     groups: list[GroupResponse]
 
 
+class ExperimentCursor(BaseModel):
+    """Keyset cursor pointing just past the last experiment of a page."""
+    after_created_at: datetime
+    after_id: UUID
+
+
 class ExperimentListResponse(BaseModel):
     """Response for listing experiments."""
     experiments: list[ExperimentResponse]
     total: int
+    next_cursor: Optional[ExperimentCursor] = None
 
 
 class ErrorResponse(BaseModel):
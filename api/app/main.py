@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import os
+import json
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from sqlalchemy.exc import IntegrityError, OperationalError, TimeoutError as PoolTimeoutError
 
-from app.database import init_db
+from app.database import async_engine, init_db
 from app.users.routes import router as users_router
+from app.users.repository import UserAlreadyExistsError, UserNotFoundError
 from app.experiments.routes import router as experiments_router
+from app.experiments.repository import ExperimentNotFoundError, InvalidAdminError
 from app.rounds.routes import router as rounds_router
+from app.rounds.repository import RoundNotFoundError
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally create database tables on startup; close pooled connections on shutdown.
+
+    Schema is normally managed by Alembic, so ``init_db()`` only runs when
+    ``RUN_INIT_DB=1`` is set (e.g. for a fresh local database).
+
+    Do not raise on failure — in local/dev environments DB may not
+    be available or may require manual setup. Log the error and
+    let the app start so other non-DB endpoints remain available.
+    """
+    if os.getenv("RUN_INIT_DB") == "1":
+        try:
+            init_db()
+        except Exception as e:  # pragma: no cover - operational/runtime issue
+            # Avoid failing app startup due to DB connectivity issues.
+            print(f"init_db() failed: {e}")
+    # Routers are mounted by now, so pay for schema generation before the first request
+    _openapi_json()
+    yield
+    await async_engine.dispose()
+
 
 app = FastAPI(
     title="AMM Game Backend",
     version="1.0.0",
     description="Experiment-based AMM trading platform with PostgreSQL and SQLAlchemy.",
+    lifespan=lifespan,
+    # Served below from pre-serialized bytes instead of FastAPI's default routes
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
 )
 
 # Add CORS middleware
@@ -25,33 +65,96 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database tables on startup
-@app.on_event("startup")
-async def startup():
-    """Attempt to create database tables on application startup.
-
-    Do not raise on failure — in local/dev environments DB may not
-    be available or may require manual setup. Log the error and
-    let the app start so other non-DB endpoints remain available.
-    """
-    try:
-        init_db()
-    except Exception as e:  # pragma: no cover - operational/runtime issue
-        # Avoid failing app startup due to DB connectivity issues.
-        print(f"init_db() failed: {e}")
-
 # Mount feature routers
 app.include_router(users_router, prefix="/users", tags=["users"])
 app.include_router(experiments_router, prefix="/experiments", tags=["experiments"])
 app.include_router(rounds_router, prefix="/rounds", tags=["rounds"])
 
+# FastAPI caches the schema dict but re-encodes it on every /openapi.json hit;
+# keep the encoded document instead
+_openapi_bytes: Optional[bytes] = None
+
+def _openapi_json() -> bytes:
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = json.dumps(app.openapi(), separators=(",", ":")).encode()
+    return _openapi_bytes
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema() -> Response:
+    """OpenAPI document for the API."""
+    return Response(_openapi_json(), media_type="application/json")
+
+# Like FastAPI's default docs routes, honour root_path so the pages fetch the
+# schema through a path-prefix proxy
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui(request: Request) -> HTMLResponse:
+    """Swagger UI."""
+    openapi_url = request.scope.get("root_path", "") + "/openapi.json"
+    return get_swagger_ui_html(openapi_url=openapi_url, title=f"{app.title} - Swagger UI")
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc(request: Request) -> HTMLResponse:
+    """ReDoc UI."""
+    openapi_url = request.scope.get("root_path", "") + "/openapi.json"
+    return get_redoc_html(openapi_url=openapi_url, title=f"{app.title} - ReDoc")
+
+# Domain errors that mean the same thing in every router are mapped here once;
+# route-specific ones (e.g. ValueError -> 400) are still translated in the routes
+_DOMAIN_ERROR_STATUS = {
+    ExperimentNotFoundError: status.HTTP_404_NOT_FOUND,
+    RoundNotFoundError: status.HTTP_404_NOT_FOUND,
+    UserNotFoundError: status.HTTP_404_NOT_FOUND,
+    InvalidAdminError: status.HTTP_403_FORBIDDEN,
+    UserAlreadyExistsError: status.HTTP_400_BAD_REQUEST,
+}
+
+async def domain_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Respond with the error's mapped status and its message as ``detail``."""
+    return JSONResponse(status_code=_DOMAIN_ERROR_STATUS[type(exc)], content={"detail": str(exc)})
+
+for error_cls in _DOMAIN_ERROR_STATUS:
+    app.add_exception_handler(error_cls, domain_error_handler)
+
+# Database errors are mapped here once instead of in every route; anything
+# else propagates to Starlette's default 500 handler
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+    """Constraint violations (duplicates, dangling foreign keys) are client conflicts."""
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": "Request conflicts with existing data"},
+    )
+
+@app.exception_handler(OperationalError)
+@app.exception_handler(PoolTimeoutError)
+async def database_unavailable_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Lost connections and pool exhaustion are reported as temporary unavailability."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database temporarily unavailable"},
+    )
+
+# Return annotations double as response models, so FastAPI serializes these
+# straight to JSON bytes with pydantic-core like the feature routers
 @app.get("/health")
-async def health_check():
+async def health_check() -> dict[str, str]:
     """Health check endpoint."""
     return {"status": "ok", "version": "1.0.0"}
 
+@app.get("/metrics/pool")
+async def pool_metrics() -> dict[str, int]:
+    """Connection pool usage for the async database engine."""
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
 @app.get("/")
-async def root():
+async def root() -> dict[str, Any]:
     """Root endpoint with API information."""
     return {
         "message": "AMM Game Backend API",
@@ -63,8 +166,3 @@ async def root():
             "rounds": "/rounds",
         }
     }
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "ok", "version": "0.4.0"}
@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from .base import Base
@@ -16,12 +13,12 @@ class Currency(Base):
     
     __tablename__ = "currencies"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     symbol = Column(String(10), unique=True, nullable=False, index=True)
     name_en = Column(String(100), nullable=False)
     name_he = Column(String(100), nullable=False)
     image_url = Column(String(500), nullable=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     def __repr__(self):
         return f"<Currency(id={self.id}, symbol={self.symbol})>"
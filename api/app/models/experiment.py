@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, synonym
 
 from .base import Base
 
@@ -17,23 +14,32 @@ class Experiment(Base):
     
     __tablename__ = "experiments"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     name = Column(String(200), nullable=False)
-    admin_id = Column(PG_UUID(as_uuid=True), ForeignKey("admin_users.id"), nullable=False, index=True)
+    admin_id = Column(PG_UUID(as_uuid=True), ForeignKey("admin_users.id"), nullable=False)
     num_rounds = Column(Integer, nullable=False)
     num_training_rounds = Column(Integer, nullable=False)
     num_rounds_for_payment = Column(Integer, nullable=False)
     num_players = Column(Integer, nullable=False)
     num_groups = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     started_at = Column(DateTime(timezone=True), nullable=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
 
+    # API/repository name for admin_id
+    created_by_id = synonym("admin_id")
+
     # Relationships
     admin = relationship("AdminUser", back_populates="experiments")
     rounds = relationship("Round", back_populates="experiment", cascade="all, delete-orphan")
     groups = relationship("Group", back_populates="experiment", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Serves the "experiments by creator, newest first" listing (and
+        # plain admin_id lookups, so admin_id has no index of its own)
+        Index("ix_experiments_creator_created", admin_id, created_at.desc()),
+    )
+
     def __repr__(self):
         return f"<Experiment(id={self.id}, name={self.name})>"
 
@@ -43,10 +49,10 @@ class Group(Base):
     
     __tablename__ = "groups"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     experiment_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiments.id"), nullable=False, index=True)
     group_number = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     experiment = relationship("Experiment", back_populates="groups")
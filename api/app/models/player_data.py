@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, JSON
+from sqlalchemy import Column, DateTime, ForeignKey, JSON, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
+from .types import FixedPoint
 
 
 class PlayerCurrencyKnowledge(Base):
@@ -17,11 +15,11 @@ class PlayerCurrencyKnowledge(Base):
     
     __tablename__ = "player_currency_knowledge"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     player_id = Column(PG_UUID(as_uuid=True), ForeignKey("player_users.id"), nullable=False, index=True)
     experiment_round_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiment_rounds.id"), nullable=False, index=True)
     revealed_currency_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     player = relationship("PlayerUser", back_populates="currency_knowledge")
@@ -37,12 +35,12 @@ class PlayerBalance(Base):
     
     __tablename__ = "player_balances"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     player_id = Column(PG_UUID(as_uuid=True), ForeignKey("player_users.id"), nullable=False, index=True)
     experiment_round_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiment_rounds.id"), nullable=False, index=True)
     currency_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
-    balance = Column(Numeric(20, 8), nullable=False, default=0)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    balance = Column(FixedPoint(8), nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     player = relationship("PlayerUser", back_populates="balances")
@@ -58,11 +56,11 @@ class UserFeedback(Base):
     
     __tablename__ = "user_feedbacks"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     player_id = Column(PG_UUID(as_uuid=True), ForeignKey("player_users.id"), nullable=False, index=True)
     experiment_round_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiment_rounds.id"), nullable=False, index=True)
     feedback_items = Column(JSON, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     player = relationship("PlayerUser", back_populates="feedbacks")
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, Integer, Boolean, ForeignKey, Numeric
+from sqlalchemy import Column, DateTime, Integer, Boolean, Computed, ForeignKey, Index, Numeric, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
+from .types import FixedPoint
 
 
 class Round(Base):
@@ -17,19 +15,20 @@ class Round(Base):
     
     __tablename__ = "rounds"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    experiment_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiments.id"), nullable=False, index=True)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    experiment_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiments.id"), nullable=False)
     round_number = Column(Integer, nullable=False)
     is_training_round = Column(Boolean, nullable=False, index=True)
     counts_for_payment = Column(Boolean, nullable=False, index=True)
     duration_minutes = Column(Integer, nullable=False)
     currency_x_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
     currency_y_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
-    external_price_x = Column(Numeric(20, 8), nullable=False)
-    external_price_y = Column(Numeric(20, 8), nullable=False)
+    # Reference prices are display/scoring inputs, not balances: load them as float
+    external_price_x = Column(Numeric(20, 8, asdecimal=False), nullable=False)
+    external_price_y = Column(Numeric(20, 8, asdecimal=False), nullable=False)
     initial_reserve_x = Column(Numeric(20, 8), nullable=False)
     initial_reserve_y = Column(Numeric(20, 8), nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     started_at = Column(DateTime(timezone=True), nullable=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -39,6 +38,11 @@ class Round(Base):
     currency_y = relationship("Currency", foreign_keys=[currency_y_id])
     experiment_rounds = relationship("ExperimentRound", back_populates="round", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Rounds of an experiment in order (also covers lookups by experiment_id alone)
+        Index("ix_rounds_experiment_roundnum", experiment_id, round_number),
+    )
+
     def __repr__(self):
         return f"<Round(id={self.id}, experiment_id={self.experiment_id}, number={self.round_number})>"
 
@@ -48,17 +52,22 @@ class ExperimentRound(Base):
     
     __tablename__ = "experiment_rounds"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    round_id = Column(PG_UUID(as_uuid=True), ForeignKey("rounds.id"), nullable=False, index=True)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
+    round_id = Column(PG_UUID(as_uuid=True), ForeignKey("rounds.id"), nullable=False)
     group_id = Column(PG_UUID(as_uuid=True), ForeignKey("groups.id"), nullable=False, index=True)
-    reserve_x = Column(Numeric(20, 8), nullable=False)
-    reserve_y = Column(Numeric(20, 8), nullable=False)
-    k_constant = Column(Numeric(40, 16), nullable=False)
+    reserve_x = Column(FixedPoint(8), nullable=False)
+    reserve_y = Column(FixedPoint(8), nullable=False)
+    # Reserves are stored in 10**-8 units, so scale the product back down to 16 decimals
+    k_constant = Column(
+        Numeric(40, 16),
+        Computed("CAST(reserve_x AS NUMERIC) * reserve_y * 0.0000000000000001", persisted=True),
+        nullable=False,
+    )
     transaction_fee_percent = Column(Numeric(5, 2), nullable=False, default=0)
     is_active = Column(Boolean, nullable=False, default=False, index=True)
     started_at = Column(DateTime(timezone=True), nullable=True, index=True)
     ended_at = Column(DateTime(timezone=True), nullable=True, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # Relationships
     round = relationship("Round", back_populates="experiment_rounds")
@@ -68,5 +77,12 @@ class ExperimentRound(Base):
     feedbacks = relationship("UserFeedback", back_populates="experiment_round", cascade="all, delete-orphan")
     player_balances = relationship("PlayerBalance", back_populates="experiment_round", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Pool of a group in a round (also covers lookups by round_id alone)
+        Index("ix_exp_rounds_round_group", round_id, group_id, unique=True),
+        # Active pools only
+        Index("ix_active_exp_rounds", round_id, postgresql_where=text("is_active")),
+    )
+
     def __repr__(self):
         return f"<ExperimentRound(id={self.id}, round_id={self.round_id}, group_id={self.group_id})>"
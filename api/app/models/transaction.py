@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Numeric, Boolean, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
+from .types import FixedPoint
 
 
 class Transaction(Base):
@@ -17,16 +15,16 @@ class Transaction(Base):
     
     __tablename__ = "transactions"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     experiment_round_id = Column(PG_UUID(as_uuid=True), ForeignKey("experiment_rounds.id"), nullable=False, index=True)
     player_id = Column(PG_UUID(as_uuid=True), ForeignKey("player_users.id"), nullable=False, index=True)
     currency_in_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
-    amount_in = Column(Numeric(20, 8), nullable=False)
+    amount_in = Column(FixedPoint(8), nullable=False)
     currency_out_id = Column(PG_UUID(as_uuid=True), ForeignKey("currencies.id"), nullable=False, index=True)
-    amount_out = Column(Numeric(20, 8), nullable=False)
+    amount_out = Column(FixedPoint(8), nullable=False)
     price_ratio = Column(Numeric(20, 8), nullable=False)
     has_completed = Column(Boolean, nullable=False, default=True, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
 
     # Relationships
     experiment_round = relationship("ExperimentRound", back_populates="transactions")
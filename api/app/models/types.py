@@ -0,0 +1,36 @@
+# app/models/types.py
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class FixedPoint(TypeDecorator):
+    """Decimal amount stored as a BIGINT count of 10**-scale units.
+
+    Integer columns are narrower and faster to compare and sum than NUMERIC,
+    while Python code keeps working with Decimal values of the given scale.
+    With the default scale of 8, amounts up to about 92 billion fit.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def __init__(self, scale: int = 8):
+        super().__init__()
+        self.scale = scale
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(value.scaleb(self.scale).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-self.scale)
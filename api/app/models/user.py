@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import uuid4
-
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Numeric
+from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, Index, Numeric, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -18,15 +15,15 @@ class User(Base):
     
     __tablename__ = "users"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     username = Column(String(100), unique=True, nullable=False, index=True)
     user_type = Column(Enum(UserType), nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Polymorphic configuration
@@ -35,6 +32,11 @@ class User(Base):
         "polymorphic_identity": None,
     }
 
+    __table_args__ = (
+        # Serves the keyset-paginated "users, newest first" listing
+        Index("ix_users_created_id", created_at.desc(), id.desc()),
+    )
+
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, type={self.user_type})>"
 
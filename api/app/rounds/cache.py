@@ -0,0 +1,113 @@
+# app/rounds/cache.py
+
+from __future__ import annotations
+
+import time
+from uuid import UUID
+from typing import Optional
+
+from .schemas import ExperimentRoundResponse, RoundListResponse
+
+
+# Round listings are read far more often than they change, and every change
+# goes through the rounds router (or experiment deletion), which invalidates
+# the affected entries. Invalidation is per process, so the TTL bounds how
+# long other worker processes can serve a stale listing.
+ROUND_CACHE_TTL_SECONDS = 300
+_ROUND_CACHE_MAXSIZE = 1024
+
+# Round listings are keyed by (experiment_id, skip, limit)
+_rounds_by_experiment: dict[tuple[UUID, int, int], tuple[float, RoundListResponse]] = {}
+_pools_by_round: dict[UUID, tuple[float, list[ExperimentRoundResponse]]] = {}
+
+# Bumped on every invalidation. Readers take the generation before querying
+# and only store their result if it is unchanged, so a listing read before a
+# concurrent change commits is never cached after that change's invalidation.
+_experiment_generations: dict[UUID, int] = {}
+_round_generations: dict[UUID, int] = {}
+_all_pools_generation = 0
+
+
+def _get(cache: dict, key):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= ROUND_CACHE_TTL_SECONDS:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def _put(cache: dict, key, value) -> None:
+    if len(cache) >= _ROUND_CACHE_MAXSIZE:
+        cache.clear()
+    cache[key] = (time.monotonic(), value)
+
+
+def rounds_generation(experiment_id: UUID) -> int:
+    """Current invalidation generation of an experiment's round listing."""
+    return _experiment_generations.get(experiment_id, 0)
+
+
+def get_rounds_for_experiment(experiment_id: UUID, skip: int, limit: int) -> Optional[RoundListResponse]:
+    """Get a cached page of an experiment's round listing, if any."""
+    return _get(_rounds_by_experiment, (experiment_id, skip, limit))
+
+
+def set_rounds_for_experiment(
+    experiment_id: UUID,
+    skip: int,
+    limit: int,
+    response: RoundListResponse,
+    generation: int,
+) -> None:
+    """Cache a page of an experiment's round listing read at ``generation``."""
+    if generation != rounds_generation(experiment_id):
+        return
+    _put(_rounds_by_experiment, (experiment_id, skip, limit), response)
+
+
+def _drop_experiment_pages(experiment_id: UUID) -> None:
+    _experiment_generations[experiment_id] = rounds_generation(experiment_id) + 1
+    for key in [key for key in _rounds_by_experiment if key[0] == experiment_id]:
+        del _rounds_by_experiment[key]
+
+
+def pools_generation(round_id: UUID) -> tuple[int, int]:
+    """Current invalidation generation of a round's pool listing."""
+    return _all_pools_generation, _round_generations.get(round_id, 0)
+
+
+def get_round_pools(round_id: UUID) -> Optional[list[ExperimentRoundResponse]]:
+    """Get the cached pool listing for a round, if any."""
+    return _get(_pools_by_round, round_id)
+
+
+def set_round_pools(
+    round_id: UUID,
+    response: list[ExperimentRoundResponse],
+    generation: tuple[int, int],
+) -> None:
+    """Cache the pool listing for a round read at ``generation``."""
+    if generation != pools_generation(round_id):
+        return
+    _put(_pools_by_round, round_id, response)
+
+
+def invalidate_round(experiment_id: UUID, round_id: Optional[UUID] = None) -> None:
+    """Drop cached listings affected by a change to a round (or to an experiment's round set)."""
+    _drop_experiment_pages(experiment_id)
+    if round_id is not None:
+        _round_generations[round_id] = _round_generations.get(round_id, 0) + 1
+        _pools_by_round.pop(round_id, None)
+
+
+def invalidate_experiment(experiment_id: UUID) -> None:
+    """Drop cached listings for an experiment that was deleted with all its rounds."""
+    global _all_pools_generation
+    _drop_experiment_pages(experiment_id)
+    # Pool entries are keyed by round, so drop them all rather than look the rounds up
+    _all_pools_generation += 1
+    _pools_by_round.clear()
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from uuid import UUID
-from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Optional
 from decimal import Decimal
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, exists, false, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.models import Round, ExperimentRound, Experiment, Group, Currency, PlayerBalance, PlayerCurrencyKnowledge
 
@@ -22,23 +23,116 @@ class ExperimentRoundNotFoundError(Exception):
     pass
 
 
-def get_round_by_id(db: Session, round_id: UUID) -> Optional[Round]:
+_DECIMAL_FIELDS = frozenset({"initial_reserve_x", "initial_reserve_y"})
+_FLOAT_FIELDS = frozenset({"external_price_x", "external_price_y"})
+
+# Scale of the NUMERIC(20, 8) round columns; values are rounded up front so the
+# in-memory object matches what the database stores without a refresh
+_AMOUNT_QUANTUM = Decimal("0.00000001")
+_AMOUNT_DIGITS = 8
+
+# Hot lookups are built once so each call only binds new parameter values.
+# Listing responses only use columns, so any relationship access raises
+# instead of silently issuing one lazy SELECT per row.
+_ROUNDS_BY_EXPERIMENT = (
+    select(Round, func.count().over().label("total"))
+    .where(Round.experiment_id == bindparam("experiment_id"))
+    .order_by(Round.round_number)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+    .options(raiseload("*"))
+)
+_ROUND_COUNT_BY_EXPERIMENT = (
+    select(func.count())
+    .select_from(Round)
+    .where(Round.experiment_id == bindparam("experiment_id"))
+)
+_EXPERIMENT_ROUNDS_BY_ROUND = (
+    select(ExperimentRound)
+    .where(ExperimentRound.round_id == bindparam("round_id"))
+    .options(raiseload("*"))
+)
+_EXPERIMENT_ROUND_BY_GROUP = (
+    select(ExperimentRound)
+    .where(
+        ExperimentRound.round_id == bindparam("round_id"),
+        ExperimentRound.group_id == bindparam("group_id"),
+    )
+    .options(raiseload("*"))
+)
+# Pool activation/deactivation when a round starts/ends; no pool objects are
+# loaded, so there is nothing in the session to synchronize. (Bind names must
+# differ from column names in UPDATE statements.)
+_ACTIVATE_EXPERIMENT_ROUNDS = (
+    update(ExperimentRound)
+    .where(ExperimentRound.round_id == bindparam("rid"))
+    .values(is_active=True, started_at=bindparam("at"))
+    .execution_options(synchronize_session=False)
+)
+_DEACTIVATE_EXPERIMENT_ROUNDS = (
+    update(ExperimentRound)
+    .where(ExperimentRound.round_id == bindparam("rid"))
+    .values(is_active=False, ended_at=bindparam("at"))
+    .execution_options(synchronize_session=False)
+)
+
+
+# Currencies are never deleted, so an ID verified once stays valid for the process
+_known_currency_ids: set[UUID] = set()
+
+
+async def _currencies_exist(db: AsyncSession, *currency_ids: UUID) -> bool:
+    """Check that all the given currencies exist.
+    
+    Currencies are assumed never to be deleted, so IDs found once are cached
+    for the life of the process; a currency deleted directly in the database
+    is still treated as existing until the process restarts.
+    """
+    unknown = set(currency_ids) - _known_currency_ids
+    if not unknown:
+        return True
+    
+    # Membership only: fetch the matching IDs in one query instead of hydrating rows
+    found = set(await db.scalars(select(Currency.id).where(Currency.id.in_(unknown))))
+    _known_currency_ids.update(found)
+    return found == unknown
+
+
+async def get_round_by_id(db: AsyncSession, round_id: UUID) -> Optional[Round]:
     """Get a round by ID."""
-    return db.query(Round).filter(Round.id == round_id).first()
+    return await db.get(Round, round_id)
 
 
-def get_rounds_by_experiment(db: Session, experiment_id: UUID) -> list[Round]:
-    """Get all rounds for an experiment."""
-    return (
-        db.query(Round)
-        .filter(Round.experiment_id == experiment_id)
-        .order_by(Round.round_number)
-        .all()
+async def round_exists(db: AsyncSession, round_id: UUID) -> bool:
+    """Check whether a round exists."""
+    return await db.scalar(select(exists().where(Round.id == round_id)))
+
+
+async def get_rounds_by_experiment(
+    db: AsyncSession,
+    experiment_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+) -> tuple[list[Round], int]:
+    """Get a page of an experiment's rounds (by round number) and the total round count.
+    
+    The total is computed with ``count(*) OVER ()`` in the same query as the page.
+    """
+    result = await db.execute(
+        _ROUNDS_BY_EXPERIMENT,
+        {"experiment_id": experiment_id, "skip": skip, "limit": limit},
     )
+    rows = result.all()
+    if rows:
+        return [row.Round for row in rows], rows[0].total
+    
+    # Empty first page means no rounds; a later page still needs a COUNT
+    total = await db.scalar(_ROUND_COUNT_BY_EXPERIMENT, {"experiment_id": experiment_id}) if skip else 0
+    return [], total
 
 
-def create_round(
-    db: Session,
+async def create_round(
+    db: AsyncSession,
     experiment_id: UUID,
     round_number: int,
     is_training_round: bool,
@@ -48,100 +142,118 @@ def create_round(
     currency_y_id: UUID,
     external_price_x: float,
     external_price_y: float,
-    initial_reserve_x: float,
-    initial_reserve_y: float,
+    initial_reserve_x: Decimal,
+    initial_reserve_y: Decimal,
 ) -> Round:
     """Create a new round configuration."""
     # Verify experiment exists
-    experiment = db.query(Experiment).filter(Experiment.id == experiment_id).first()
+    experiment = await db.get(Experiment, experiment_id)
     if not experiment:
         raise ValueError(f"Experiment {experiment_id} not found")
     
     # Verify currencies exist
-    currency_x = db.query(Currency).filter(Currency.id == currency_x_id).first()
-    currency_y = db.query(Currency).filter(Currency.id == currency_y_id).first()
-    if not currency_x or not currency_y:
+    if not await _currencies_exist(db, currency_x_id, currency_y_id):
         raise ValueError("Invalid currency IDs")
     
-    round_obj = Round(
-        experiment_id=experiment_id,
-        round_number=round_number,
-        is_training_round=is_training_round,
-        counts_for_payment=counts_for_payment,
-        duration_minutes=duration_minutes,
-        currency_x_id=currency_x_id,
-        currency_y_id=currency_y_id,
-        external_price_x=Decimal(str(external_price_x)),
-        external_price_y=Decimal(str(external_price_y)),
-        initial_reserve_x=Decimal(str(initial_reserve_x)),
-        initial_reserve_y=Decimal(str(initial_reserve_y)),
+    # Core INSERT ... RETURNING skips the unit-of-work flush and hands back
+    # the generated ID and defaults
+    result = await db.execute(
+        insert(Round)
+        .values(
+            experiment_id=experiment_id,
+            round_number=round_number,
+            is_training_round=is_training_round,
+            counts_for_payment=counts_for_payment,
+            duration_minutes=duration_minutes,
+            currency_x_id=currency_x_id,
+            currency_y_id=currency_y_id,
+            external_price_x=round(external_price_x, _AMOUNT_DIGITS),
+            external_price_y=round(external_price_y, _AMOUNT_DIGITS),
+            initial_reserve_x=initial_reserve_x.quantize(_AMOUNT_QUANTUM),
+            initial_reserve_y=initial_reserve_y.quantize(_AMOUNT_QUANTUM),
+        )
+        .returning(Round)
     )
+    round_obj = result.scalar_one()
     
-    db.add(round_obj)
-    db.commit()
-    db.refresh(round_obj)
+    await db.commit()
     return round_obj
 
 
-def initialize_experiment_rounds(db: Session, round_id: UUID) -> list[ExperimentRound]:
+async def _insert_experiment_rounds(db: AsyncSession, round_obj: Round) -> None:
+    """Insert an inactive pool for each group of the round's experiment that has none yet.
+    
+    Runs as a single INSERT ... SELECT ... WHERE NOT EXISTS (without committing),
+    so repeated initialization never duplicates a group's pool.
+    """
+    pool_columns = ExperimentRound.__table__.c
+    # k_constant is computed by the database
+    await db.execute(
+        insert(ExperimentRound)
+        .from_select(
+            ["round_id", "group_id", "reserve_x", "reserve_y", "transaction_fee_percent", "is_active"],
+            select(
+                literal(round_obj.id, pool_columns.round_id.type),
+                Group.id,
+                literal(round_obj.initial_reserve_x, pool_columns.reserve_x.type),
+                literal(round_obj.initial_reserve_y, pool_columns.reserve_y.type),
+                literal(Decimal("0"), pool_columns.transaction_fee_percent.type),  # Default 0% fee
+                false(),  # Activated when the round starts
+            ).where(
+                Group.experiment_id == round_obj.experiment_id,
+                ~exists().where(
+                    ExperimentRound.round_id == round_obj.id,
+                    ExperimentRound.group_id == Group.id,
+                ),
+            ),
+        )
+    )
+
+
+async def initialize_experiment_rounds(db: AsyncSession, round_id: UUID) -> list[ExperimentRound]:
     """Initialize experiment rounds (pool instances) for all groups when a round starts.
     
-    This creates one ExperimentRound per group, each with its own reserves.
+    This creates one ExperimentRound per group, each with its own reserves;
+    groups that already have a pool for the round are skipped. Returns all of
+    the round's pools, including ones created by an earlier call.
     """
-    round_obj = get_round_by_id(db, round_id)
+    round_obj = await get_round_by_id(db, round_id)
     if not round_obj:
         raise RoundNotFoundError(f"Round {round_id} not found")
     
-    # Get all groups for this experiment
-    groups = db.query(Group).filter(Group.experiment_id == round_obj.experiment_id).all()
-    
-    experiment_rounds = []
-    for group in groups:
-        # Calculate k_constant
-        k_constant = round_obj.initial_reserve_x * round_obj.initial_reserve_y
-        
-        exp_round = ExperimentRound(
-            round_id=round_id,
-            group_id=group.id,
-            reserve_x=round_obj.initial_reserve_x,
-            reserve_y=round_obj.initial_reserve_y,
-            k_constant=k_constant,
-            transaction_fee_percent=Decimal("0"),  # Default 0% fee
-            is_active=False,  # Will be activated when round starts
-        )
-        db.add(exp_round)
-        experiment_rounds.append(exp_round)
-    
-    db.commit()
-    for exp_round in experiment_rounds:
-        db.refresh(exp_round)
-    
-    return experiment_rounds
+    await _insert_experiment_rounds(db, round_obj)
+    await db.commit()
+    return await get_experiment_rounds_by_round(db, round_id)
 
 
-def start_round(db: Session, round_id: UUID) -> Round:
-    """Start a round - activate all experiment rounds and initialize player balances."""
-    round_obj = get_round_by_id(db, round_id)
-    if not round_obj:
-        raise RoundNotFoundError(f"Round {round_id} not found")
+async def start_round(db: AsyncSession, round_id: UUID, initialize_pools: bool = False) -> Round:
+    """Start a round - activate all experiment rounds and initialize player balances.
     
-    if round_obj.started_at:
+    With ``initialize_pools`` any missing pools are created in the same
+    transaction instead of requiring a separate initialize call first.
+    The ``started_at IS NULL`` guard is part of the UPDATE, so concurrent
+    starts cannot both succeed.
+    """
+    result = await db.execute(
+        update(Round)
+        .where(Round.id == round_id, Round.started_at.is_(None))
+        .values(started_at=func.now())
+        .returning(Round)
+    )
+    round_obj = result.scalars().first()
+    if not round_obj:
+        if not await round_exists(db, round_id):
+            raise RoundNotFoundError(f"Round {round_id} not found")
         raise ValueError("Round has already been started")
     
-    # Mark round as started
-    round_obj.started_at = datetime.now(timezone.utc)
+    # One timestamp shared by the round and its pools
+    now = round_obj.started_at
     
-    # Get all experiment rounds for this round
-    experiment_rounds = (
-        db.query(ExperimentRound)
-        .filter(ExperimentRound.round_id == round_id)
-        .all()
-    )
+    if initialize_pools:
+        await _insert_experiment_rounds(db, round_obj)
     
-    # Activate all experiment rounds and set started_at
-    for exp_round in experiment_rounds:
-        exp_round.is_active = True
-        exp_round.started_at = datetime.now(timezone.utc)
+    # Activate all experiment rounds and set started_at in a single UPDATE
+    await db.execute(_ACTIVATE_EXPERIMENT_ROUNDS, {"rid": round_id, "at": now})
     
     # TODO: Initialize player balances and currency knowledge
     # This would involve:
@@ -149,87 +261,100 @@ def start_round(db: Session, round_id: UUID) -> Round:
     # 2. Create PlayerBalance for each player/currency/experiment_round
     # 3. Create PlayerCurrencyKnowledge (random assignment)
     
-    db.commit()
-    db.refresh(round_obj)
+    await db.commit()
     return round_obj
 
 
-def end_round(db: Session, round_id: UUID) -> Round:
+async def end_round(db: AsyncSession, round_id: UUID) -> Round:
     """End a round - deactivate all experiment rounds."""
-    round_obj = get_round_by_id(db, round_id)
+    result = await db.execute(
+        update(Round)
+        .where(
+            Round.id == round_id,
+            Round.started_at.is_not(None),
+            Round.ended_at.is_(None),
+        )
+        .values(ended_at=func.now())
+        .returning(Round)
+    )
+    round_obj = result.scalars().first()
     if not round_obj:
-        raise RoundNotFoundError(f"Round {round_id} not found")
-    
-    if not round_obj.started_at:
-        raise ValueError("Cannot end a round that hasn't started")
-    
-    if round_obj.ended_at:
+        # Nothing matched: work out which precondition failed
+        round_obj = await get_round_by_id(db, round_id)
+        if not round_obj:
+            raise RoundNotFoundError(f"Round {round_id} not found")
+        if not round_obj.started_at:
+            raise ValueError("Cannot end a round that hasn't started")
         raise ValueError("Round has already ended")
     
-    # Mark round as ended
-    round_obj.ended_at = datetime.now(timezone.utc)
-    
-    # Get all experiment rounds for this round
-    experiment_rounds = (
-        db.query(ExperimentRound)
-        .filter(ExperimentRound.round_id == round_id)
-        .all()
-    )
-    
-    # Deactivate all experiment rounds and set ended_at
-    for exp_round in experiment_rounds:
-        exp_round.is_active = False
-        exp_round.ended_at = datetime.now(timezone.utc)
+    # Deactivate all experiment rounds with the round's end timestamp in a single UPDATE
+    await db.execute(_DEACTIVATE_EXPERIMENT_ROUNDS, {"rid": round_id, "at": round_obj.ended_at})
     
-    db.commit()
-    db.refresh(round_obj)
+    await db.commit()
     return round_obj
 
 
-def get_experiment_round_by_id(db: Session, experiment_round_id: UUID) -> Optional[ExperimentRound]:
+async def get_experiment_round_by_id(db: AsyncSession, experiment_round_id: UUID) -> Optional[ExperimentRound]:
     """Get an experiment round by ID."""
-    return db.query(ExperimentRound).filter(ExperimentRound.id == experiment_round_id).first()
+    return await db.get(ExperimentRound, experiment_round_id)
 
 
-def get_experiment_rounds_by_round(db: Session, round_id: UUID) -> list[ExperimentRound]:
+async def get_experiment_rounds_by_round(db: AsyncSession, round_id: UUID) -> list[ExperimentRound]:
     """Get all experiment rounds (pool instances) for a round."""
-    return db.query(ExperimentRound).filter(ExperimentRound.round_id == round_id).all()
+    result = await db.scalars(_EXPERIMENT_ROUNDS_BY_ROUND, {"round_id": round_id})
+    return list(result)
 
 
-def get_experiment_round_by_group(db: Session, round_id: UUID, group_id: UUID) -> Optional[ExperimentRound]:
+async def iter_experiment_rounds_by_round(
+    db: AsyncSession,
+    round_id: UUID,
+    batch_size: int = 500,
+) -> AsyncIterator[ExperimentRound]:
+    """Iterate over all experiment rounds for a round, fetching ``batch_size`` rows at a time.
+    
+    Rows come from a server-side cursor, so memory stays bounded for rounds
+    with many groups. Prefer get_experiment_rounds_by_round for small rounds.
+    """
+    query = _EXPERIMENT_ROUNDS_BY_ROUND.execution_options(yield_per=batch_size)
+    result = await db.stream_scalars(query, {"round_id": round_id})
+    async for experiment_round in result:
+        yield experiment_round
+
+
+async def get_experiment_round_by_group(db: AsyncSession, round_id: UUID, group_id: UUID) -> Optional[ExperimentRound]:
     """Get the experiment round for a specific group in a specific round."""
-    return (
-        db.query(ExperimentRound)
-        .filter(ExperimentRound.round_id == round_id, ExperimentRound.group_id == group_id)
-        .first()
-    )
+    result = await db.scalars(_EXPERIMENT_ROUND_BY_GROUP, {"round_id": round_id, "group_id": group_id})
+    return result.first()
 
 
-def update_round(db: Session, round_id: UUID, **update_data) -> Round:
+async def update_round(db: AsyncSession, round_id: UUID, **update_data) -> Round:
     """Update a round configuration."""
-    round_obj = get_round_by_id(db, round_id)
+    round_obj = await get_round_by_id(db, round_id)
     if not round_obj:
         raise RoundNotFoundError(f"Round {round_id} not found")
     
     # Update only provided fields
     for field, value in update_data.items():
         if value is not None and hasattr(round_obj, field):
-            # Convert floats to Decimal for numeric fields
-            if field in ['external_price_x', 'external_price_y', 'initial_reserve_x', 'initial_reserve_y']:
-                value = Decimal(str(value))
+            # Reserves normally arrive as Decimal and prices as float from the schema
+            if field in _DECIMAL_FIELDS:
+                if not isinstance(value, Decimal):
+                    value = Decimal(str(value))
+                value = value.quantize(_AMOUNT_QUANTUM)
+            elif field in _FLOAT_FIELDS:
+                value = round(float(value), _AMOUNT_DIGITS)
             setattr(round_obj, field, value)
     
-    db.commit()
-    db.refresh(round_obj)
+    await db.commit()
     return round_obj
 
 
-def delete_round(db: Session, round_id: UUID) -> bool:
+async def delete_round(db: AsyncSession, round_id: UUID) -> bool:
     """Delete a round."""
-    round_obj = get_round_by_id(db, round_id)
+    round_obj = await get_round_by_id(db, round_id)
     if not round_obj:
         raise RoundNotFoundError(f"Round {round_id} not found")
     
-    db.delete(round_obj)
-    db.commit()
+    await db.delete(round_obj)
+    await db.commit()
     return True
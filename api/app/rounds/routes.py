@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from uuid import UUID
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .schemas import (
     RoundCreate,
@@ -19,6 +21,7 @@ from .schemas import (
 from .repository import (
     create_round as repo_create_round,
     get_round_by_id,
+    round_exists,
     get_rounds_by_experiment,
     initialize_experiment_rounds as repo_initialize_experiment_rounds,
     start_round as repo_start_round,
@@ -27,12 +30,35 @@ from .repository import (
     get_experiment_round_by_group,
     update_round as repo_update_round,
     delete_round as repo_delete_round,
-    RoundNotFoundError,
 )
-from app.database import get_db
+from app.database import get_async_db
+from app.models import ExperimentRound
+from . import cache as round_cache
 
 router = APIRouter()
 
+ROUND_LIST_ADAPTER = TypeAdapter(list[RoundResponse])
+EXPERIMENT_ROUND_LIST_ADAPTER = TypeAdapter(list[ExperimentRoundResponse])
+
+
+def _pool_etag(experiment_round: ExperimentRound) -> str:
+    """ETag over the pool fields that change after creation."""
+    state = (
+        f"{experiment_round.id}:{experiment_round.reserve_x}:{experiment_round.reserve_y}:"
+        f"{experiment_round.transaction_fee_percent}:{experiment_round.is_active}:"
+        f"{experiment_round.started_at}:{experiment_round.ended_at}"
+    )
+    return f'"{hashlib.blake2b(state.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison, so ``W/`` is ignored)."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 # -------------------- Routes -------------------- #
 
@@ -42,13 +68,13 @@ router = APIRouter()
     status_code=status.HTTP_201_CREATED,
     responses={400: {"model": ErrorResponse}},
 )
-def create_round(
+async def create_round(
     round_data: RoundCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Create a new round configuration for an experiment."""
     try:
-        round_obj = repo_create_round(
+        round_obj = await repo_create_round(
             db=db,
             experiment_id=round_data.experiment_id,
             round_number=round_data.round_number,
@@ -62,6 +88,7 @@ def create_round(
             initial_reserve_x=round_data.initial_reserve_x,
             initial_reserve_y=round_data.initial_reserve_y,
         )
+        round_cache.invalidate_round(round_obj.experiment_id)
         return RoundResponse.model_validate(round_obj)
     
     except ValueError as e:
@@ -69,33 +96,31 @@ def create_round(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create round: {str(e)}",
-        )
 
 
 @router.get(
     "/experiment/{experiment_id}",
     response_model=RoundListResponse,
 )
-def list_rounds_for_experiment(
+async def list_rounds_for_experiment(
     experiment_id: UUID,
-    db: Session = Depends(get_db),
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all rounds for an experiment."""
-    try:
-        rounds = get_rounds_by_experiment(db, experiment_id)
-        return RoundListResponse(
-            rounds=[RoundResponse.model_validate(r) for r in rounds],
-            total=len(rounds),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list rounds: {str(e)}",
-        )
+    """List the rounds of an experiment, ordered by round number."""
+    cached = round_cache.get_rounds_for_experiment(experiment_id, skip, limit)
+    if cached is not None:
+        return cached
+    
+    generation = round_cache.rounds_generation(experiment_id)
+    rounds, total = await get_rounds_by_experiment(db, experiment_id, skip=skip, limit=limit)
+    response = RoundListResponse(
+        rounds=ROUND_LIST_ADAPTER.validate_python(rounds, from_attributes=True),
+        total=total,
+    )
+    round_cache.set_rounds_for_experiment(experiment_id, skip, limit, response, generation)
+    return response
 
 
 @router.get(
@@ -103,26 +128,18 @@ def list_rounds_for_experiment(
     response_model=RoundResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def get_round(
+async def get_round(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a round by ID."""
-    try:
-        round_obj = get_round_by_id(db, round_id)
-        if not round_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Round {round_id} not found",
-            )
-        return RoundResponse.model_validate(round_obj)
-    except HTTPException:
-        raise
-    except Exception as e:
+    round_obj = await get_round_by_id(db, round_id)
+    if not round_obj:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get round: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Round {round_id} not found",
         )
+    return RoundResponse.model_validate(round_obj)
 
 
 @router.post(
@@ -130,29 +147,20 @@ def get_round(
     response_model=List[ExperimentRoundResponse],
     responses={404: {"model": ErrorResponse}},
 )
-def initialize_round_pools(
+async def initialize_round_pools(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Initialize experiment rounds (pool instances) for all groups.
     
     This creates one pool per group with the initial reserves from the round configuration.
-    Call this before starting the round.
+    Call this before starting the round. Calling it again only adds pools for
+    groups that have none; the response always lists all of the round's pools.
     """
-    try:
-        experiment_rounds = repo_initialize_experiment_rounds(db, round_id)
-        return [ExperimentRoundResponse.model_validate(er) for er in experiment_rounds]
-    
-    except RoundNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to initialize round pools: {str(e)}",
-        )
+    experiment_rounds = await repo_initialize_experiment_rounds(db, round_id)
+    round_obj = await get_round_by_id(db, round_id)
+    round_cache.invalidate_round(round_obj.experiment_id, round_id)
+    return EXPERIMENT_ROUND_LIST_ADAPTER.validate_python(experiment_rounds, from_attributes=True)
 
 
 @router.post(
@@ -160,30 +168,26 @@ def initialize_round_pools(
     response_model=RoundResponse,
     responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
 )
-def start_round(
+async def start_round(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    initialize: bool = False,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Start a round (activate all pools and initialize player balances)."""
+    """Start a round (activate all pools and initialize player balances).
+    
+    Pass ``initialize=true`` to create the pools as part of the start, instead
+    of calling ``/initialize`` in a separate request first.
+    """
     try:
-        round_obj = repo_start_round(db, round_id)
+        round_obj = await repo_start_round(db, round_id, initialize_pools=initialize)
+        round_cache.invalidate_round(round_obj.experiment_id, round_id)
         return RoundResponse.model_validate(round_obj)
     
-    except RoundNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start round: {str(e)}",
-        )
 
 
 @router.post(
@@ -191,30 +195,21 @@ def start_round(
     response_model=RoundResponse,
     responses={404: {"model": ErrorResponse}, 400: {"model": ErrorResponse}},
 )
-def end_round(
+async def end_round(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """End a round (deactivate all pools)."""
     try:
-        round_obj = repo_end_round(db, round_id)
+        round_obj = await repo_end_round(db, round_id)
+        round_cache.invalidate_round(round_obj.experiment_id, round_id)
         return RoundResponse.model_validate(round_obj)
     
-    except RoundNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to end round: {str(e)}",
-        )
 
 
 @router.get(
@@ -222,59 +217,63 @@ def end_round(
     response_model=List[ExperimentRoundResponse],
     responses={404: {"model": ErrorResponse}},
 )
-def list_round_pools(
+async def list_round_pools(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all experiment rounds (pool instances) for a round."""
-    try:
-        # Verify round exists
-        round_obj = get_round_by_id(db, round_id)
-        if not round_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Round {round_id} not found",
-            )
-        
-        experiment_rounds = get_experiment_rounds_by_round(db, round_id)
-        return [ExperimentRoundResponse.model_validate(er) for er in experiment_rounds]
+    cached = round_cache.get_round_pools(round_id)
+    if cached is not None:
+        return cached
     
-    except HTTPException:
-        raise
-    except Exception as e:
+    generation = round_cache.pools_generation(round_id)
+    experiment_rounds = await get_experiment_rounds_by_round(db, round_id)
+    # Only an empty result needs the extra existence check
+    if not experiment_rounds and not await round_exists(db, round_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list round pools: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Round {round_id} not found",
         )
+    
+    response = EXPERIMENT_ROUND_LIST_ADAPTER.validate_python(experiment_rounds, from_attributes=True)
+    round_cache.set_round_pools(round_id, response, generation)
+    return response
 
 
 @router.get(
     "/{round_id}/pools/group/{group_id}",
     response_model=ExperimentRoundResponse,
-    responses={404: {"model": ErrorResponse}},
+    responses={
+        304: {"description": "Pool unchanged since the given ETag"},
+        404: {"model": ErrorResponse},
+    },
 )
-def get_group_pool(
+async def get_group_pool(
     round_id: UUID,
     group_id: UUID,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get the pool (experiment round) for a specific group in a round."""
-    try:
-        experiment_round = get_experiment_round_by_group(db, round_id, group_id)
-        if not experiment_round:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Pool for group {group_id} in round {round_id} not found",
-            )
-        return ExperimentRoundResponse.model_validate(experiment_round)
+    """Get the pool (experiment round) for a specific group in a round.
     
-    except HTTPException:
-        raise
-    except Exception as e:
+    Clients polling the pool can send the last ``ETag`` as ``If-None-Match``
+    and get an empty 304 while the pool is unchanged.
+    """
+    experiment_round = await get_experiment_round_by_group(db, round_id, group_id)
+    if not experiment_round:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get group pool: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pool for group {group_id} in round {round_id} not found",
         )
+    
+    etag = _pool_etag(experiment_round)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    return ExperimentRoundResponse.model_validate(experiment_round)
 
 
 @router.patch(
@@ -282,27 +281,16 @@ def get_group_pool(
     response_model=RoundResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def update_round(
+async def update_round(
     round_id: UUID,
     round_data: RoundUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update a round configuration."""
-    try:
-        update_dict = round_data.model_dump(exclude_unset=True)
-        round_obj = repo_update_round(db, round_id, **update_dict)
-        return RoundResponse.model_validate(round_obj)
-    
-    except RoundNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update round: {str(e)}",
-        )
+    update_dict = round_data.model_dump(exclude_unset=True)
+    round_obj = await repo_update_round(db, round_id, **update_dict)
+    round_cache.invalidate_round(round_obj.experiment_id, round_id)
+    return RoundResponse.model_validate(round_obj)
 
 
 @router.delete(
@@ -310,22 +298,13 @@ def update_round(
     status_code=status.HTTP_204_NO_CONTENT,
     responses={404: {"model": ErrorResponse}},
 )
-def delete_round(
+async def delete_round(
     round_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Delete a round."""
-    try:
-        repo_delete_round(db, round_id)
-        return None
-    
-    except RoundNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete round: {str(e)}",
-        )
+    # Look the round up first (an identity-map hit for the delete) to know its experiment
+    round_obj = await get_round_by_id(db, round_id)
+    await repo_delete_round(db, round_id)
+    round_cache.invalidate_round(round_obj.experiment_id, round_id)
+    return None
@@ -7,7 +7,12 @@ from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Pool reserves are copied from the round's initial reserves into BIGINT
+# columns of 10**-8 units (FixedPoint(8)), so larger values cannot be stored
+_MAX_RESERVE = Decimal(2**63 - 1).scaleb(-8)
 
 
 # -------------------- Request Schemas -------------------- #
@@ -23,8 +28,8 @@ class RoundCreate(BaseModel):
     currency_y_id: UUID
     external_price_x: float = Field(..., gt=0)
     external_price_y: float = Field(..., gt=0)
-    initial_reserve_x: float = Field(..., gt=0)
-    initial_reserve_y: float = Field(..., gt=0)
+    initial_reserve_x: Decimal = Field(..., gt=0, le=_MAX_RESERVE)
+    initial_reserve_y: Decimal = Field(..., gt=0, le=_MAX_RESERVE)
 
 
 class RoundUpdate(BaseModel):
@@ -34,14 +39,16 @@ class RoundUpdate(BaseModel):
     duration_minutes: Optional[int] = Field(None, gt=0)
     external_price_x: Optional[float] = Field(None, gt=0)
     external_price_y: Optional[float] = Field(None, gt=0)
-    initial_reserve_x: Optional[float] = Field(None, gt=0)
-    initial_reserve_y: Optional[float] = Field(None, gt=0)
+    initial_reserve_x: Optional[Decimal] = Field(None, gt=0, le=_MAX_RESERVE)
+    initial_reserve_y: Optional[Decimal] = Field(None, gt=0, le=_MAX_RESERVE)
 
 
 # -------------------- Response Schemas -------------------- #
 
 class RoundResponse(BaseModel):
     """Response schema for a round."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     experiment_id: UUID
     round_number: int
@@ -50,20 +57,19 @@ class RoundResponse(BaseModel):
     duration_minutes: int
     currency_x_id: UUID
     currency_y_id: UUID
-    external_price_x: Decimal
-    external_price_y: Decimal
+    external_price_x: float
+    external_price_y: float
     initial_reserve_x: Decimal
     initial_reserve_y: Decimal
     started_at: Optional[datetime]
     ended_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ExperimentRoundResponse(BaseModel):
     """Response schema for an experiment round (pool instance)."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     round_id: UUID
     group_id: UUID
@@ -76,9 +82,6 @@ class ExperimentRoundResponse(BaseModel):
     ended_at: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class RoundListResponse(BaseModel):
     """Response for listing rounds."""
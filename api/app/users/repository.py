@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from uuid import UUID
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy import exists, select, func, tuple_
 
 from app.models import User, AdminUser, PlayerUser
 from app.models.enums import UserType
@@ -27,38 +29,72 @@ class InvalidCredentialsError(Exception):
     pass
 
 
-def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
+_USER_CLASSES: dict[UserType, type[User]] = {
+    UserType.ADMIN: AdminUser,
+    UserType.PLAYER: PlayerUser,
+}
+
+
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
     """Get a user by their ID."""
-    return db.query(User).filter(User.id == user_id).first()
+    return await db.get(User, user_id)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Get a user by their email."""
-    return db.query(User).filter(User.email == email).first()
+    result = await db.scalars(select(User).where(User.email == email))
+    return result.first()
 
 
-def get_admin_user(db: Session, user_id: UUID) -> Optional[AdminUser]:
+async def get_admin_user(db: AsyncSession, user_id: UUID) -> Optional[AdminUser]:
     """Get an admin user by ID."""
-    return db.query(AdminUser).filter(AdminUser.id == user_id).first()
+    return await db.get(AdminUser, user_id)
 
 
-def get_player_user(db: Session, user_id: UUID) -> Optional[PlayerUser]:
+async def get_player_user(db: AsyncSession, user_id: UUID) -> Optional[PlayerUser]:
     """Get a player user by ID."""
-    return db.query(PlayerUser).filter(PlayerUser.id == user_id).first()
+    return await db.get(PlayerUser, user_id)
 
 
-def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
-    """Get all users with pagination."""
-    return db.query(User).offset(skip).limit(limit).all()
+async def get_all_users(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[UUID] = None,
+) -> tuple[list[User], int]:
+    """Get a page of users (newest first) and the total user count.
+    
+    Pass the last row's ``created_at``/``id`` as ``after_created_at``/``after_id``
+    to seek straight to the next page instead of scanning past ``skip`` rows.
+    """
+    # Total ignores the cursor, so count in a scalar subquery rather than OVER ()
+    count_query = select(func.count()).select_from(User)
+    query = select(User, count_query.scalar_subquery().label("total")).options(raiseload("*"))
+    
+    if after_created_at is not None and after_id is not None:
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(after_created_at, after_id))
+    
+    query = query.order_by(User.created_at.desc(), User.id.desc())
+    result = await db.execute(query.offset(skip).limit(limit))
+    rows = result.all()
+    if rows:
+        return [row.User for row in rows], rows[0].total
+    
+    # Page is past the end (or there are no users): fall back to a plain COUNT
+    total = await db.scalar(count_query)
+    return [], total
 
 
-def get_all_players(db: Session, skip: int = 0, limit: int = 100) -> list[PlayerUser]:
+async def get_all_players(db: AsyncSession, skip: int = 0, limit: int = 100) -> list[PlayerUser]:
     """Get all player users with pagination."""
-    return db.query(PlayerUser).offset(skip).limit(limit).all()
+    # PlayerUserResponse only reads columns; fail loudly on any relationship access
+    result = await db.scalars(select(PlayerUser).options(raiseload("*")).offset(skip).limit(limit))
+    return list(result)
 
 
-def create_user(
-    db: Session,
+async def create_user(
+    db: AsyncSession,
     email: str,
     password_hash: str,
     user_type: UserType,
@@ -70,66 +106,61 @@ def create_user(
     Note: This function expects password_hash, not plain password.
     Password hashing should be done before calling this function.
     """
-    # Check if user already exists
-    existing_user = get_user_by_email(db, email)
-    if existing_user:
+    # Check if user already exists (EXISTS avoids materializing the row)
+    if await db.scalar(select(exists().where(User.email == email))):
         raise UserAlreadyExistsError(f"User with email {email} already exists")
     
     # Create appropriate user type
-    if user_type == UserType.ADMIN:
-        user = AdminUser(
-            email=email,
-            password_hash=password_hash,
-            username=username,
-            user_type=user_type,
-        )
-    elif user_type == UserType.PLAYER:
-        user = PlayerUser(
-            email=email,
-            password_hash=password_hash,
-            username=username,
-            user_type=user_type,
-            group_id=group_id,
-        )
-    else:
+    user_cls = _USER_CLASSES.get(user_type)
+    if user_cls is None:
         raise ValueError(f"Invalid user type: {user_type}")
     
+    fields = {
+        "email": email,
+        "password_hash": password_hash,
+        "username": username,
+        "user_type": user_type,
+    }
+    if user_cls is PlayerUser:
+        fields["group_id"] = group_id
+    user = user_cls(**fields)
+    
+    # id and timestamps come back from the INSERT's RETURNING clause
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     return user
 
 
-def update_player_group(db: Session, player_id: UUID, group_id: UUID) -> PlayerUser:
+async def update_player_group(db: AsyncSession, player_id: UUID, group_id: UUID) -> PlayerUser:
     """Assign a player to a group."""
-    player = get_player_user(db, player_id)
+    player = await get_player_user(db, player_id)
     if not player:
         raise UserNotFoundError(f"Player with id {player_id} not found")
     
     player.group_id = group_id
-    db.commit()
-    db.refresh(player)
+    # Only player_users changes, so no server-side values need reloading
+    await db.commit()
     return player
 
 
-def update_player_payment(db: Session, player_id: UUID, payment_amount: float) -> PlayerUser:
+async def update_player_payment(db: AsyncSession, player_id: UUID, payment_amount: float) -> PlayerUser:
     """Update a player's payment amount."""
-    player = get_player_user(db, player_id)
+    player = await get_player_user(db, player_id)
     if not player:
         raise UserNotFoundError(f"Player with id {player_id} not found")
     
     player.payment_amount_ils = payment_amount
-    db.commit()
-    db.refresh(player)
+    # Only player_users changes, so no server-side values need reloading
+    await db.commit()
     return player
 
 
-def delete_user(db: Session, user_id: UUID) -> bool:
+async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
     """Delete a user by ID."""
-    user = get_user_by_id(db, user_id)
+    user = await get_user_by_id(db, user_id)
     if not user:
         raise UserNotFoundError(f"User with id {user_id} not found")
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
     return True
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from uuid import UUID
+from datetime import datetime
 from typing import List
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .schemas import (
     UserRegister,
@@ -16,6 +21,7 @@ from .schemas import (
     AdminUserResponse,
     PlayerUserResponse,
     UserListResponse,
+    UserCursor,
     PlayerAssignGroup,
     ErrorResponse,
 )
@@ -26,36 +32,37 @@ from .repository import (
     get_all_users,
     get_all_players,
     update_player_group,
-    UserAlreadyExistsError,
-    UserNotFoundError,
     InvalidCredentialsError,
 )
-from app.database import get_db
+from app.database import get_async_db
 from app.models.enums import UserType
 
 router = APIRouter()
 
+# argon2id with ~64 MiB memory cost; tune time_cost/memory_cost to the deployment's CPUs
+_PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+USER_LIST_ADAPTER = TypeAdapter(list[UserBase])
+PLAYER_LIST_ADAPTER = TypeAdapter(list[PlayerUserResponse])
+
 
 # -------------------- Helper Functions -------------------- #
 
-def hash_password(password: str) -> str:
-    """Hash a password. 
+async def hash_password(password: str) -> str:
+    """Hash a password with argon2id.
     
-    TODO: Implement proper password hashing (bcrypt, argon2, etc.)
-    For now, this is a placeholder.
+    Hashing is deliberately CPU-heavy, so it runs in the threadpool to keep
+    the event loop free for other requests.
     """
-    # SECURITY WARNING: This is NOT secure! Use bcrypt or passlib in production
-    return f"hashed_{password}"
+    return await run_in_threadpool(_PASSWORD_HASHER.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash.
-    
-    TODO: Implement proper password verification.
-    For now, this is a placeholder.
-    """
-    # SECURITY WARNING: This is NOT secure! Use bcrypt or passlib in production
-    return hashed_password == f"hashed_{plain_password}"
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against an argon2 hash (in the threadpool, like hashing)."""
+    try:
+        return await run_in_threadpool(_PASSWORD_HASHER.verify, hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def create_access_token(user_id: UUID) -> str:
@@ -76,36 +83,24 @@ def create_access_token(user_id: UUID) -> str:
     status_code=status.HTTP_201_CREATED,
     responses={400: {"model": ErrorResponse}},
 )
-def register_user(
+async def register_user(
     user_data: UserRegister,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Register a new user (Admin or Player)."""
-    try:
-        # Hash the password
-        password_hash = hash_password(user_data.password)
-        
-        # Create user
-        user = repo_create_user(
-            db=db,
-            email=user_data.email,
-            password_hash=password_hash,
-            user_type=user_data.user_type,
-            username=user_data.username,
-        )
-        
-        return UserBase.model_validate(user)
+    # Hash the password
+    password_hash = await hash_password(user_data.password)
     
-    except UserAlreadyExistsError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to register user: {str(e)}",
-        )
+    # Create user
+    user = await repo_create_user(
+        db=db,
+        email=user_data.email,
+        password_hash=password_hash,
+        user_type=user_data.user_type,
+        username=user_data.username,
+    )
+    
+    return UserBase.model_validate(user)
 
 
 @router.post(
@@ -113,65 +108,73 @@ def register_user(
     response_model=UserLoginResponse,
     responses={401: {"model": ErrorResponse}},
 )
-def login_user(
+async def login_user(
     login_data: UserLogin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Login a user and return access token."""
-    try:
-        # Get user by email
-        user = get_user_by_email(db, login_data.email)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-            )
-        
-        # Verify password
-        if not verify_password(login_data.password, user.password_hash):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password",
-            )
-        
-        # Create access token
-        access_token = create_access_token(user.id)
-        
-        return UserLoginResponse(
-            user=UserBase.model_validate(user),
-            access_token=access_token,
+    # Get user by email
+    user = await get_user_by_email(db, login_data.email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
         )
     
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Verify password
+    if not await verify_password(login_data.password, user.password_hash):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to login: {str(e)}",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
         )
+    
+    # Create access token
+    access_token = create_access_token(user.id)
+    
+    return UserLoginResponse(
+        user=UserBase.model_validate(user),
+        access_token=access_token,
+    )
 
 
 @router.get(
     "/",
     response_model=UserListResponse,
 )
-def list_users(
+async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    after_created_at: datetime = None,  # Keyset cursor (from next_cursor)
+    after_id: UUID = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """List all users."""
-    try:
-        users = get_all_users(db, skip=skip, limit=limit)
-        return UserListResponse(
-            users=[UserBase.model_validate(u) for u in users],
-            total=len(users),
-        )
-    except Exception as e:
+    """List all users, newest first.
+    
+    Pass the previous page's ``next_cursor`` values as ``after_created_at`` and
+    ``after_id`` to fetch the next page.
+    """
+    if (after_created_at is None) != (after_id is None):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list users: {str(e)}",
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="after_created_at and after_id must be given together",
         )
+    
+    users, total = await get_all_users(
+        db,
+        skip=skip,
+        limit=limit,
+        after_created_at=after_created_at,
+        after_id=after_id,
+    )
+    next_cursor = None
+    if users and len(users) == limit:
+        last = users[-1]
+        next_cursor = UserCursor(after_created_at=last.created_at, after_id=last.id)
+    return UserListResponse(
+        users=USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
+        total=total,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get(
@@ -179,46 +182,32 @@ def list_users(
     response_model=UserBase,
     responses={404: {"model": ErrorResponse}},
 )
-def get_user(
+async def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Get a user by ID."""
-    try:
-        user = get_user_by_id(db, user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with id {user_id} not found",
-            )
-        return UserBase.model_validate(user)
-    except HTTPException:
-        raise
-    except Exception as e:
+    user = await get_user_by_id(db, user_id)
+    if not user:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get user: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found",
         )
+    return UserBase.model_validate(user)
 
 
 @router.get(
     "/players/list",
     response_model=List[PlayerUserResponse],
 )
-def list_players(
+async def list_players(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all player users."""
-    try:
-        players = get_all_players(db, skip=skip, limit=limit)
-        return [PlayerUserResponse.model_validate(p) for p in players]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list players: {str(e)}",
-        )
+    players = await get_all_players(db, skip=skip, limit=limit)
+    return PLAYER_LIST_ADAPTER.validate_python(players, from_attributes=True)
 
 
 @router.post(
@@ -226,21 +215,10 @@ def list_players(
     response_model=PlayerUserResponse,
     responses={404: {"model": ErrorResponse}},
 )
-def assign_player_to_group(
+async def assign_player_to_group(
     assignment: PlayerAssignGroup,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Assign a player to a group."""
-    try:
-        player = update_player_group(db, assignment.player_id, assignment.group_id)
-        return PlayerUserResponse.model_validate(player)
-    except UserNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to assign player to group: {str(e)}",
-        )
+    player = await update_player_group(db, assignment.player_id, assignment.group_id)
+    return PlayerUserResponse.model_validate(player)
@@ -6,7 +6,7 @@ from uuid import UUID
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.models.enums import UserType
 
@@ -37,15 +37,14 @@ class PlayerAssignGroup(BaseModel):
 
 class UserBase(BaseModel):
     """Base user information."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: UUID
     email: str
     username: Optional[str]
     user_type: UserType
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class AdminUserResponse(UserBase):
     """Response schema for admin users."""
@@ -54,12 +53,11 @@ class AdminUserResponse(UserBase):
 
 class PlayerUserResponse(UserBase):
     """Response schema for player users."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     group_id: Optional[UUID]
     payment_amount_ils: Optional[float]
 
-    class Config:
-        from_attributes = True
-
 
 class UserLoginResponse(BaseModel):
     """Response after successful login."""
@@ -68,10 +66,17 @@ class UserLoginResponse(BaseModel):
     token_type: str = "bearer"
 
 
+class UserCursor(BaseModel):
+    """Keyset cursor pointing just past the last user of a page."""
+    after_created_at: datetime
+    after_id: UUID
+
+
 class UserListResponse(BaseModel):
     """Response for listing users."""
     users: list[UserBase]
     total: int
+    next_cursor: Optional[UserCursor] = None
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,42 @@
+"""generate uuid primary keys server-side
+
+Revision ID: 5e0b8d42c6f1
+Revises: a3c91e5d7b20
+Create Date: 2026-10-15 10:03:17.542981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b8d42c6f1'
+down_revision = 'a3c91e5d7b20'
+branch_labels = None
+depends_on = None
+
+# Tables whose UUID primary key is generated by the database.
+# admin_users/player_users share their id with users, so they have no default.
+TABLES = [
+    'currencies',
+    'users',
+    'experiments',
+    'groups',
+    'rounds',
+    'experiment_rounds',
+    'transactions',
+    'player_currency_knowledge',
+    'player_balances',
+    'user_feedbacks',
+]
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13, so no extension is needed
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,41 @@
+"""default timestamps to now()
+
+Revision ID: 8d2f6a19e4b3
+Revises: 5e0b8d42c6f1
+Create Date: 2026-10-15 11:26:51.337420
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2f6a19e4b3'
+down_revision = '5e0b8d42c6f1'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs whose timestamp is filled in by the database
+COLUMNS = [
+    ('currencies', 'created_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('experiments', 'created_at'),
+    ('groups', 'created_at'),
+    ('rounds', 'created_at'),
+    ('experiment_rounds', 'created_at'),
+    ('transactions', 'created_at'),
+    ('player_currency_knowledge', 'created_at'),
+    ('player_balances', 'updated_at'),
+    ('user_feedbacks', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=None)
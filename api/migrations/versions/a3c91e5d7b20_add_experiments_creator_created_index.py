@@ -0,0 +1,26 @@
+"""add experiments creator/created_at index
+
+Revision ID: a3c91e5d7b20
+Revises: 37ffcf7a2c83
+Create Date: 2026-10-15 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c91e5d7b20'
+down_revision = '37ffcf7a2c83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_experiments_creator_created', 'experiments', ['admin_id', sa.text('created_at DESC')], unique=False)
+    op.drop_index(op.f('ix_experiments_admin_id'), table_name='experiments')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_experiments_admin_id'), 'experiments', ['admin_id'], unique=False)
+    op.drop_index('ix_experiments_creator_created', table_name='experiments')
@@ -0,0 +1,24 @@
+"""users created_at/id keyset index
+
+Revision ID: b7e2c4a91d36
+Revises: f2b6d08a5c13
+Create Date: 2026-10-15 21:40:12.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2c4a91d36'
+down_revision = 'f2b6d08a5c13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_created_id', 'users', [sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_created_id', table_name='users')
@@ -0,0 +1,32 @@
+"""composite and partial round indexes
+
+Revision ID: c47e1b9f0a58
+Revises: 8d2f6a19e4b3
+Create Date: 2026-10-15 12:08:05.904716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47e1b9f0a58'
+down_revision = '8d2f6a19e4b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_rounds_experiment_roundnum', 'rounds', ['experiment_id', 'round_number'], unique=False)
+    op.drop_index(op.f('ix_rounds_experiment_id'), table_name='rounds')
+    op.create_index('ix_exp_rounds_round_group', 'experiment_rounds', ['round_id', 'group_id'], unique=False)
+    op.create_index('ix_active_exp_rounds', 'experiment_rounds', ['round_id'], unique=False, postgresql_where=sa.text('is_active'))
+    op.drop_index(op.f('ix_experiment_rounds_round_id'), table_name='experiment_rounds')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_experiment_rounds_round_id'), 'experiment_rounds', ['round_id'], unique=False)
+    op.drop_index('ix_active_exp_rounds', table_name='experiment_rounds')
+    op.drop_index('ix_exp_rounds_round_group', table_name='experiment_rounds')
+    op.create_index(op.f('ix_rounds_experiment_id'), 'rounds', ['experiment_id'], unique=False)
+    op.drop_index('ix_rounds_experiment_roundnum', table_name='rounds')
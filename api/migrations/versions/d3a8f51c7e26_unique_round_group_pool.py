@@ -0,0 +1,31 @@
+"""one pool per round and group
+
+Revision ID: d3a8f51c7e26
+Revises: b7e2c4a91d36
+Create Date: 2026-10-15 22:05:47.511839
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a8f51c7e26'
+down_revision = 'b7e2c4a91d36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Repeated /initialize calls could create several pools for the same group;
+    # keep the one with the lowest id so the unique index can be built
+    op.execute(
+        'DELETE FROM experiment_rounds a USING experiment_rounds b '
+        'WHERE a.round_id = b.round_id AND a.group_id = b.group_id AND a.id > b.id'
+    )
+    op.drop_index('ix_exp_rounds_round_group', table_name='experiment_rounds')
+    op.create_index('ix_exp_rounds_round_group', 'experiment_rounds', ['round_id', 'group_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exp_rounds_round_group', table_name='experiment_rounds')
+    op.create_index('ix_exp_rounds_round_group', 'experiment_rounds', ['round_id', 'group_id'], unique=False)
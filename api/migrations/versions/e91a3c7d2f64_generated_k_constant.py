@@ -0,0 +1,28 @@
+"""generated k_constant
+
+Revision ID: e91a3c7d2f64
+Revises: c47e1b9f0a58
+Create Date: 2026-10-15 12:41:19.226051
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91a3c7d2f64'
+down_revision = 'c47e1b9f0a58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_column('experiment_rounds', 'k_constant')
+    op.add_column('experiment_rounds', sa.Column('k_constant', sa.Numeric(precision=40, scale=16), sa.Computed('reserve_x * reserve_y', persisted=True), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('experiment_rounds', 'k_constant')
+    op.add_column('experiment_rounds', sa.Column('k_constant', sa.Numeric(precision=40, scale=16), nullable=True))
+    op.execute('UPDATE experiment_rounds SET k_constant = reserve_x * reserve_y')
+    op.alter_column('experiment_rounds', 'k_constant', nullable=False)
@@ -0,0 +1,53 @@
+"""fixed-point amount columns
+
+Revision ID: f2b6d08a5c13
+Revises: e91a3c7d2f64
+Create Date: 2026-10-15 13:17:52.640318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b6d08a5c13'
+down_revision = 'e91a3c7d2f64'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs stored as BIGINT counts of 10**-8 units
+FIXED_POINT_COLUMNS = [
+    ('experiment_rounds', 'reserve_x'),
+    ('experiment_rounds', 'reserve_y'),
+    ('transactions', 'amount_in'),
+    ('transactions', 'amount_out'),
+    ('player_balances', 'balance'),
+]
+
+
+def upgrade() -> None:
+    # The generated k_constant depends on the reserves, so drop it while they change type
+    op.drop_column('experiment_rounds', 'k_constant')
+    for table, column in FIXED_POINT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.BigInteger(),
+            existing_type=sa.Numeric(precision=20, scale=8),
+            postgresql_using=f'round({column} * 100000000)::bigint',
+        )
+    op.add_column('experiment_rounds', sa.Column('k_constant', sa.Numeric(precision=40, scale=16), sa.Computed('CAST(reserve_x AS NUMERIC) * reserve_y * 0.0000000000000001', persisted=True), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('experiment_rounds', 'k_constant')
+    for table, column in FIXED_POINT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Numeric(precision=20, scale=8),
+            existing_type=sa.BigInteger(),
+            postgresql_using=f'{column}::numeric / 100000000',
+        )
+    op.add_column('experiment_rounds', sa.Column('k_constant', sa.Numeric(precision=40, scale=16), sa.Computed('reserve_x * reserve_y', persisted=True), nullable=False))
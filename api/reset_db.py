@@ -4,7 +4,9 @@ Use this in development only!
 """
 
 import sys
+from psycopg2 import sql
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 import os
 from dotenv import load_dotenv
 
@@ -12,18 +14,10 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", f"postgresql://{os.getenv('DATABASE_USER','ammuser')}:{os.getenv('DATABASE_PASSWORD','ammpassword')}@{os.getenv('DATABASE_HOST','localhost')}:{os.getenv('DATABASE_PORT','5432')}/{os.getenv('DATABASE_NAME','amm_db')}")
 
-# Extract connection parameters
-from urllib.parse import urlparse
-parsed = urlparse(DATABASE_URL)
-
-db_user = parsed.username
-db_password = parsed.password
-db_host = parsed.hostname
-db_port = parsed.port or 5432
-db_name = parsed.path.lstrip('/')
-
-# Connection to PostgreSQL default database (postgres)
-ADMIN_URL = f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/postgres"
+# Connection to PostgreSQL default database (postgres), same server and credentials
+url = make_url(DATABASE_URL)
+db_name = url.database
+ADMIN_URL = url.set(drivername="postgresql+psycopg2", database="postgres")
 
 print("Connecting to PostgreSQL...")
 admin_engine = create_engine(ADMIN_URL)
@@ -36,18 +30,23 @@ try:
         cursor = conn.cursor()
 
         print(f"Terminating all connections to '{db_name}'...")
-        cursor.execute(f"""
+        cursor.execute(
+            """
             SELECT pg_terminate_backend(pg_stat_activity.pid)
             FROM pg_stat_activity
-            WHERE pg_stat_activity.datname = '{db_name}'
+            WHERE pg_stat_activity.datname = %s
             AND pid <> pg_backend_pid();
-        """)
+            """,
+            (db_name,),
+        )
         
+        # DROP/CREATE DATABASE cannot run inside a transaction block, so they stay
+        # separate autocommit statements; the name is quoted as an identifier
         print(f"Dropping database '{db_name}'...")
-        cursor.execute(f"DROP DATABASE IF EXISTS {db_name};")
+        cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {};").format(sql.Identifier(db_name)))
         
         print(f"Creating database '{db_name}'...")
-        cursor.execute(f"CREATE DATABASE {db_name};")
+        cursor.execute(sql.SQL("CREATE DATABASE {};").format(sql.Identifier(db_name)))
         
         cursor.close()
 